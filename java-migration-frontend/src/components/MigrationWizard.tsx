@@ -9,6 +9,7 @@ import {
   startMigration,
   getMigrationStatus,
   getMigrationLogs,
+  clearRepoCache,
 } from "../services/api";
 import type {
   RepoInfo,
@@ -61,6 +62,49 @@ const MIGRATION_STEPS = [
   },
 ];
 
+// URL normalization patterns, compiled once rather than on every render of step 1
+const TREE_PATH_RE = /\/tree\/[^/]+.*$/;
+const BLOB_PATH_RE = /\/blob\/[^/]+.*$/;
+const SRC_PATH_RE = /\/src\/.*$/;
+// Matches a trailing .git and/or slash
+const REPO_SUFFIX_RE = /(?:\.git)?\/?$/;
+// Matches https://github.com/owner/repo or the owner/repo short form
+const REPO_URL_RE = /^(?:https?:\/\/(?:www\.)?github\.com\/)?[^/]+\/[^/\s]+$/;
+
+function normalizeGithubUrl(url: string): { valid: boolean; normalizedUrl: string; message: string } {
+  if (!url.trim()) {
+    return { valid: false, normalizedUrl: "", message: "URL is required" };
+  }
+
+  let normalized = url.trim();
+
+  // Remove /tree/branch-name and everything after it
+  normalized = normalized.replace(TREE_PATH_RE, '');
+  // Remove /blob/branch-name and everything after it
+  normalized = normalized.replace(BLOB_PATH_RE, '');
+  // Remove /src/ paths
+  normalized = normalized.replace(SRC_PATH_RE, '');
+  // Remove trailing slash and .git extension
+  normalized = normalized.replace(REPO_SUFFIX_RE, '');
+
+  if (REPO_URL_RE.test(normalized)) {
+    if (url !== normalized) {
+      return { 
+        valid: true, 
+        normalizedUrl: normalized, 
+        message: `✓ URL normalized (removed tree/blob paths)` 
+      };
+    }
+    return { valid: true, normalizedUrl: normalized, message: "" };
+  }
+
+  return { 
+    valid: false, 
+    normalizedUrl: "", 
+    message: "Invalid URL format. Use: https://github.com/owner/repo or owner/repo" 
+  };
+}
+
 export default function MigrationWizard({ onBackToHome }: { onBackToHome?: () => void }) {
   const [step, setStep] = useState(1);
   const [repoUrl, setRepoUrl] = useState("");
@@ -156,6 +200,8 @@ export default function MigrationWizard({ onBackToHome }: { onBackToHome?: () =>
             lastUpdateTime = Date.now();
             // Auto-advance to report when completed
             if (job.status === "completed") {
+              // Pushed content makes cached repository reads stale
+              clearRepoCache();
               setStep(11);
               // Fetch detailed logs
               getMigrationLogs(job.job_id).then((logs) => setMigrationLogs(logs.logs));
@@ -277,46 +323,6 @@ export default function MigrationWizard({ onBackToHome }: { onBackToHome?: () =>
     </div>
   );
 
-  const normalizeGithubUrl = (url: string): { valid: boolean; normalizedUrl: string; message: string } => {
-    if (!url.trim()) {
-      return { valid: false, normalizedUrl: "", message: "URL is required" };
-    }
-
-    let normalized = url.trim();
-
-    // Remove /tree/branch-name and everything after it
-    normalized = normalized.replace(/\/tree\/[^/]+.*$/, '');
-    // Remove /blob/branch-name and everything after it
-    normalized = normalized.replace(/\/blob\/[^/]+.*$/, '');
-    // Remove /src/ paths
-    normalized = normalized.replace(/\/src\/.*$/, '');
-    // Remove trailing slashes
-    normalized = normalized.replace(/\/$/, '');
-    // Remove .git extension
-    normalized = normalized.replace(/\.git$/, '');
-
-    // Check if it's a valid format
-    const isGithubUrl = /^https?:\/\/(www\.)?github\.com\/[^/]+\/[^/\s]+$/.test(normalized);
-    const isShortFormat = /^[^/]+\/[^/\s]+$/.test(normalized);
-
-    if (isGithubUrl || isShortFormat) {
-      if (url !== normalized) {
-        return { 
-          valid: true, 
-          normalizedUrl: normalized, 
-          message: `✓ URL normalized (removed tree/blob paths)` 
-        };
-      }
-      return { valid: true, normalizedUrl: normalized, message: "" };
-    }
-
-    return { 
-      valid: false, 
-      normalizedUrl: "", 
-      message: "Invalid URL format. Use: https://github.com/owner/repo or owner/repo" 
-    };
-  };
-
   const renderStep1 = () => {
     const urlValidation = repoUrl ? normalizeGithubUrl(repoUrl) : { valid: false, normalizedUrl: "", message: "" };
     
@@ -515,13 +521,7 @@ export default function MigrationWizard({ onBackToHome }: { onBackToHome?: () =>
                     <div style={styles.field}>
                       <label style={styles.label}>
                         Detected Dependencies ({repoAnalysis.dependencies.length})
-                        <select style={styles.select} onChange={(e) => {
-                          const index = parseInt(e.target.value);
-                          if (index >= 0) {
-                            // Could show detailed info for selected dependency
-                            console.log('Selected dependency:', repoAnalysis.dependencies[index]);
-                          }
-                        }}>
+                        <select style={styles.select}>
                           <option value="">Select a dependency to view details...</option>
                           {repoAnalysis.dependencies.map((dep, idx) => (
                             <option key={idx} value={idx}>
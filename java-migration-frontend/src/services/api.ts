@@ -143,80 +143,148 @@ export interface JavaVersionInfo {
   target_versions: { value: string; label: string }[];
 }
 
+// In-memory LRU+TTL cache for read-only repository calls (repo list, analysis, list-files, file-content).
+// Repeat reads of the same repo/path within the TTL resolve from memory instead of the network.
+const REPO_CACHE_TTL_MS = 5 * 60 * 1000;
+const REPO_CACHE_MAX_ENTRIES = 256;
+
+const repoCache = new Map<string, { expiresAt: number; promise: Promise<unknown> }>();
+
+// Keys are JSON.stringify'd tuples so URLs/paths containing ':' cannot collide
+function cachedRepoRequest<T>(key: string, load: () => Promise<T>): Promise<T> {
+  const now = Date.now();
+  const hit = repoCache.get(key);
+  if (hit && hit.expiresAt > now) {
+    // Re-insert so Map iteration order tracks recency
+    repoCache.delete(key);
+    repoCache.set(key, hit);
+    return hit.promise as Promise<T>;
+  }
+  repoCache.delete(key);
+
+  const promise = load();
+  repoCache.set(key, { expiresAt: now + REPO_CACHE_TTL_MS, promise });
+  // Never cache failures
+  promise.catch(() => {
+    if (repoCache.get(key)?.promise === promise) repoCache.delete(key);
+  });
+
+  while (repoCache.size > REPO_CACHE_MAX_ENTRIES) {
+    const oldest = repoCache.keys().next().value;
+    if (oldest === undefined) break;
+    repoCache.delete(oldest);
+  }
+  return promise;
+}
+
+// Drop cached repository data, e.g. after a migration pushes new content
+export function clearRepoCache(): void {
+  repoCache.clear();
+}
+
 // Fetch GitHub repositories
 export async function fetchRepositories(token: string): Promise<RepoInfo[]> {
-  const response = await fetch(`${API_BASE_URL}/github/repos?token=${encodeURIComponent(token)}`);
-  if (!response.ok) {
-    const error = await response.json();
-    throw new Error(error.detail || 'Failed to fetch repositories');
-  }
-  return response.json();
+  return cachedRepoRequest(JSON.stringify(['repos', token]), async () => {
+    const response = await fetch(`${API_BASE_URL}/github/repos?token=${encodeURIComponent(token)}`);
+    if (!response.ok) {
+      const error = await response.json();
+      throw new Error(error.detail || 'Failed to fetch repositories');
+    }
+    return response.json();
+  });
 }
 
 // Analyze a repository
 export async function analyzeRepository(token: string, owner: string, repo: string): Promise<RepoAnalysis> {
-  const response = await fetch(
-    `${API_BASE_URL}/github/repo/${owner}/${repo}/analyze?token=${encodeURIComponent(token)}`
-  );
-  if (!response.ok) {
-    const error = await response.json();
-    throw new Error(error.detail || 'Failed to analyze repository');
-  }
-  return response.json();
+  return cachedRepoRequest(JSON.stringify(['analyze-repo', owner, repo, token]), async () => {
+    const response = await fetch(
+      `${API_BASE_URL}/github/repo/${owner}/${repo}/analyze?token=${encodeURIComponent(token)}`
+    );
+    if (!response.ok) {
+      const error = await response.json();
+      throw new Error(error.detail || 'Failed to analyze repository');
+    }
+    return response.json();
+  });
 }
 
 // NEW: Analyze repository directly by URL (works for public repos without token)
 export async function analyzeRepoUrl(repoUrl: string, token: string = ""): Promise<RepoUrlAnalysis> {
-  const response = await fetch(
-    `${API_BASE_URL}/github/analyze-url?repo_url=${encodeURIComponent(repoUrl)}&token=${encodeURIComponent(token)}`
-  );
-  if (!response.ok) {
-    const error = await response.json();
-    throw new Error(error.detail || 'Failed to analyze repository');
-  }
-  return response.json();
+  return cachedRepoRequest(JSON.stringify(['analyze-url', repoUrl, token]), async () => {
+    const response = await fetch(
+      `${API_BASE_URL}/github/analyze-url?repo_url=${encodeURIComponent(repoUrl)}&token=${encodeURIComponent(token)}`
+    );
+    if (!response.ok) {
+      const error = await response.json();
+      throw new Error(error.detail || 'Failed to analyze repository');
+    }
+    return response.json();
+  });
 }
 
 // NEW: List files in a repository (works for public repos without token)
 export async function listRepoFiles(repoUrl: string, token: string = "", path: string = ""): Promise<RepoFilesResponse> {
-  const response = await fetch(
-    `${API_BASE_URL}/github/list-files?repo_url=${encodeURIComponent(repoUrl)}&token=${encodeURIComponent(token)}&path=${encodeURIComponent(path)}`
-  );
-  if (!response.ok) {
-    const error = await response.json();
-    throw new Error(error.detail || 'Failed to list files');
-  }
-  return response.json();
+  return cachedRepoRequest(JSON.stringify(['list-files', repoUrl, path, token]), async () => {
+    const response = await fetch(
+      `${API_BASE_URL}/github/list-files?repo_url=${encodeURIComponent(repoUrl)}&token=${encodeURIComponent(token)}&path=${encodeURIComponent(path)}`
+    );
+    if (!response.ok) {
+      const error = await response.json();
+      throw new Error(error.detail || 'Failed to list files');
+    }
+    return response.json();
+  });
 }
 
 // NEW: Get file content (works for public repos without token)
 export async function getFileContent(repoUrl: string, filePath: string, token: string = ""): Promise<FileContentResponse> {
-  const response = await fetch(
-    `${API_BASE_URL}/github/file-content?repo_url=${encodeURIComponent(repoUrl)}&file_path=${encodeURIComponent(filePath)}&token=${encodeURIComponent(token)}`
-  );
-  if (!response.ok) {
-    const error = await response.json();
-    throw new Error(error.detail || 'Failed to get file content');
-  }
-  return response.json();
+  return cachedRepoRequest(JSON.stringify(['file-content', repoUrl, filePath, token]), async () => {
+    const response = await fetch(
+      `${API_BASE_URL}/github/file-content?repo_url=${encodeURIComponent(repoUrl)}&file_path=${encodeURIComponent(filePath)}&token=${encodeURIComponent(token)}`
+    );
+    if (!response.ok) {
+      const error = await response.json();
+      throw new Error(error.detail || 'Failed to get file content');
+    }
+    return response.json();
+  });
 }
 
+// Java versions and conversion types are static for the lifetime of the backend,
+// so fetch them once per page load and share the result between callers.
+let javaVersionsPromise: Promise<JavaVersionInfo> | null = null;
+let conversionTypesPromise: Promise<ConversionType[]> | null = null;
+
 // Get available Java versions
 export async function getJavaVersions(): Promise<JavaVersionInfo> {
-  const response = await fetch(`${API_BASE_URL}/java-versions`);
-  if (!response.ok) {
-    throw new Error('Failed to fetch Java versions');
+  if (!javaVersionsPromise) {
+    javaVersionsPromise = fetch(`${API_BASE_URL}/java-versions`).then((response) => {
+      if (!response.ok) {
+        throw new Error('Failed to fetch Java versions');
+      }
+      return response.json();
+    });
+    javaVersionsPromise.catch(() => {
+      javaVersionsPromise = null;
+    });
   }
-  return response.json();
+  return javaVersionsPromise;
 }
 
 // Get available conversion types
 export async function getConversionTypes(): Promise<ConversionType[]> {
-  const response = await fetch(`${API_BASE_URL}/conversion-types`);
-  if (!response.ok) {
-    throw new Error('Failed to fetch conversion types');
+  if (!conversionTypesPromise) {
+    conversionTypesPromise = fetch(`${API_BASE_URL}/conversion-types`).then((response) => {
+      if (!response.ok) {
+        throw new Error('Failed to fetch conversion types');
+      }
+      return response.json();
+    });
+    conversionTypesPromise.catch(() => {
+      conversionTypesPromise = null;
+    });
   }
-  return response.json();
+  return conversionTypesPromise;
 }
 
 // Start migration